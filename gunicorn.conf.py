@@ -0,0 +1,18 @@
+import os
+
+# Gunicorn settings, used with: gunicorn -c gunicorn.conf.py main:app
+# Listen on loopback only, so traffic has to come through Nginx; its upstream in nginx.conf
+# must name the same port. Set HOST=0.0.0.0 to serve without Nginx in front.
+# `python main.py` runs without Nginx and overrides this with -b 0.0.0.0:$PORT.
+bind = f"{os.environ.get('HOST', '127.0.0.1')}:{os.environ.get('PORT', 8080)}"
+workers = 2 * os.cpu_count() + 1
+worker_class = 'gthread'
+threads = int(os.environ.get('READER_POOL_SIZE', 8))
+
+# Each worker opens its own SQLite connections and starts its own write flusher at import,
+# and neither survives a fork, so the app must not be preloaded in the master
+preload_app = False
+
+# Only warnings and errors in production; the app's 'survey' logger has no handler of its own,
+# so its debug/info records are dropped without being formatted
+loglevel = 'warning'
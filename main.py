@@ -1,20 +1,172 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 import sqlite3
 import json
+import logging
+import msgspec
+import orjson
 from datetime import datetime
 import os
 import csv
+import hashlib
+import hmac
+import queue
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from io import StringIO
+from typing import Annotated
 
-app = Flask(__name__, static_folder='.')
+# Encode and decode JSON with orjson instead of the stdlib json module
+class ORJSONProvider(DefaultJSONProvider):
+    option = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=self.option), mimetype=self.mimetype)
+
+# Answer CORS preflights before they reach Flask's routing, extensions and views
+class CORSPreflight:
+    headers = [
+        ('Access-Control-Allow-Origin', '*'),
+        ('Access-Control-Allow-Methods', 'GET, POST, DELETE, OPTIONS'),
+        ('Access-Control-Allow-Headers', 'Content-Type'),
+        ('Access-Control-Max-Age', '86400'),
+        ('Content-Length', '0'),
+    ]
+    
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] == 'OPTIONS' and 'HTTP_ACCESS_CONTROL_REQUEST_METHOD' in environ:
+            start_response('204 No Content', self.headers)
+            return [b'']
+        return self.wsgi_app(environ, start_response)
+
+app = Flask(__name__, static_folder='static')
+app.wsgi_app = CORSPreflight(app.wsgi_app)
+log = logging.getLogger('survey')
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# Compress JSON, CSV and HTML responses, preferring brotli
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'deflate']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'text/csv', 'text/javascript', 'application/javascript', 'application/json']
+Compress(app)
+
+# Let browsers keep the static assets for a day and revalidate with a cheap 304 afterwards
+# (Flask's static route already answers If-None-Match/If-Modified-Since via send_file)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400
+
+# Columns returned by the read endpoints, in select order
+RESPONSE_COLUMNS = ('id', 'q1', 'q2', 'portal_rating', 'llm_rating', 'q4', 'q5', 'has_improvements', 'improvements', 'timestamp')
+
+# /api/responses pages are keyset-paginated on the primary key, newest first
+RESPONSES_PAGE_SIZE = 100
+RESPONSES_MAX_PAGE_SIZE = 500
+
+# Each row comes back as (id, JSON object text) so it can be emitted without building a dict
+RESPONSE_JSON_COLUMNS = '''
+    id, json_object(
+        'id', id, 'q1', q1, 'q2', json(q2), 'portal_rating', portal_rating, 'llm_rating', llm_rating,
+        'q4', q4, 'q5', q5, 'has_improvements', has_improvements, 'improvements', improvements, 'timestamp', timestamp
+    )
+'''
+
+SELECT_RESPONSES_PAGE_SQL = f'''
+    SELECT {RESPONSE_JSON_COLUMNS}
+    FROM survey_responses ORDER BY id DESC LIMIT ?
+'''
+
+SELECT_RESPONSES_BEFORE_SQL = f'''
+    SELECT {RESPONSE_JSON_COLUMNS}
+    FROM survey_responses WHERE id < ? ORDER BY id DESC LIMIT ?
+'''
+
+# Rows written per chunk when streaming the CSV export
+EXPORT_BATCH_SIZE = 500
+
+# All responses, with q2 flattened back to comma-separated text for spreadsheets
+EXPORT_RESPONSES_SQL = '''
+    SELECT id, q1, (SELECT group_concat(value, ',') FROM json_each(q2)),
+           portal_rating, llm_rating, q4, q5, has_improvements, improvements, timestamp
+    FROM survey_responses ORDER BY timestamp DESC
+'''
+
+# Statements shared by the request handlers, kept in one place alongside the queries above
+INSERT_RESPONSE_SQL = '''
+    INSERT INTO survey_responses
+    (q1, q2, portal_rating, llm_rating, q4, q5, has_improvements, improvements)
+    VALUES (?, json(?), ?, ?, ?, ?, ?, ?)
+'''
+
+RESPONSES_VERSION_SQL = "SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(MAX(timestamp), '') FROM survey_responses"
+
+# Total count, average ratings and improvement count in one pass
+STATS_TOTALS_SQL = '''
+    SELECT COUNT(*),
+           AVG(CAST(portal_rating AS REAL)),
+           AVG(CAST(llm_rating AS REAL)),
+           COALESCE(SUM(has_improvements), 0)
+    FROM survey_responses
+'''
+
+# Q1, Q4 and Q5 distributions in one statement, tagged by question
+STATS_DISTRIBUTIONS_SQL = '''
+    SELECT 'q1', q1, COUNT(*) FROM survey_responses GROUP BY q1
+    UNION ALL
+    SELECT 'q4', q4, COUNT(*) FROM survey_responses GROUP BY q4
+    UNION ALL
+    SELECT 'q5', q5, COUNT(*) FROM survey_responses GROUP BY q5
+    ORDER BY 3 DESC
+'''
+
+DELETE_RESPONSES_SQL = 'DELETE FROM survey_responses'
+
+POLL_CACHE_CONTROL = 'private, max-age=5, must-revalidate'
+
+# Open a database connection with per-connection settings applied
+def get_conn():
+    conn = sqlite3.connect('survey.db', timeout=5.0, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA foreign_keys=ON')
+    # Unlike journal_mode these settings do not persist in the db file, so every connection sets them
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-65536')
+    # Some builds default secure_delete to ON, which zero-fills every page a delete frees;
+    # FAST only scrubs what can be done without extra I/O
+    conn.execute('PRAGMA secure_delete=FAST')
+    return conn
+
+# Bump when adding a migration to init_db
+SCHEMA_VERSION = 3
+
 # Database initialization
 def init_db():
-    conn = sqlite3.connect('survey.db')
+    conn = get_conn()
     c = conn.cursor()
     
+    # WAL lets readers run alongside the writer; the journal mode persists in the db file
+    c.execute('PRAGMA journal_mode=WAL')
+    
+    # Every worker runs this at import; the write lock makes them take turns, so only the
+    # first one to get here applies the migrations below
+    c.execute('BEGIN IMMEDIATE')
+    
     # Create survey_responses table
     c.execute('''
         CREATE TABLE IF NOT EXISTS survey_responses (
@@ -34,70 +186,217 @@ def init_db():
     # Create index for faster queries
     c.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON survey_responses(timestamp)')
     
-    conn.commit()
+    # Single-column indexes let the stats GROUP BYs scan an index instead of the table
+    c.execute('CREATE INDEX IF NOT EXISTS idx_q1 ON survey_responses(q1)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_q4 ON survey_responses(q4)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_q5 ON survey_responses(q5)')
+    
+    # Covers the stats totals query, so it reads this narrow index instead of the full rows
+    c.execute('CREATE INDEX IF NOT EXISTS idx_stats_totals ON survey_responses(has_improvements, portal_rating, llm_rating)')
+    
+    # One-off migrations, each applied once per database and recorded in user_version
+    version = c.execute('PRAGMA user_version').fetchone()[0]
+    
+    if version < 1:
+        # Migrate comma-joined q2 values from older rows to JSON arrays
+        c.execute("SELECT id, q2 FROM survey_responses WHERE NOT json_valid(q2) OR json_type(q2) != 'array'")
+        legacy_rows = c.fetchall()
+        c.executemany('UPDATE survey_responses SET q2 = ? WHERE id = ?', [
+            (orjson.dumps(q2.split(',') if q2 else []).decode(), row_id) for row_id, q2 in legacy_rows
+        ])
+    
+    if version < 2:
+        # Older rows stored unanswered ratings as '' rather than NULL
+        c.execute('''
+            UPDATE survey_responses
+            SET portal_rating = NULLIF(portal_rating, ''), llm_rating = NULLIF(llm_rating, '')
+            WHERE portal_rating = '' OR llm_rating = ''
+        ''')
+    
+    if version < 3:
+        # Give the query planner statistics for the indexes above
+        c.execute('ANALYZE')
+    
+    c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    c.execute('COMMIT')
     conn.close()
     print("✓ Database initialized successfully")
 
 # Initialize database on startup
 init_db()
 
-# Serve the main HTML file
+# Persistent connections: a single serialized writer plus a pool of read-only readers.
+# Size the reader pool to the number of request threads the server runs.
+READER_POOL_SIZE = int(os.environ.get('READER_POOL_SIZE', 8))
+READER_POOL_TIMEOUT = 5
+
+_writer_lock = threading.Lock()
+_writer_conn = get_conn()
+_reader_pool = queue.Queue(maxsize=READER_POOL_SIZE)
+for _ in range(READER_POOL_SIZE):
+    _reader = get_conn()
+    _reader.execute('PRAGMA query_only=ON')
+    # Prepare the statement every polled request runs so the first request does not pay for it
+    _reader.execute(RESPONSES_VERSION_SQL).fetchone()
+    _reader_pool.put(_reader)
+
+@contextmanager
+def writer():
+    with _writer_lock:
+        try:
+            yield _writer_conn
+        finally:
+            # Never hand the next request a connection stuck mid-transaction
+            if _writer_conn.in_transaction:
+                _writer_conn.rollback()
+
+@contextmanager
+def reader():
+    try:
+        conn = _reader_pool.get(timeout=READER_POOL_TIMEOUT)
+    except queue.Empty:
+        raise RuntimeError('No database connection available, try again shortly') from None
+    try:
+        yield conn
+    finally:
+        _reader_pool.put(conn)
+
+# Submissions are queued and written in batches so concurrent requests share one commit
+WRITE_BATCH_SIZE = 256
+WRITE_TIMEOUT = 10
+
+_submit_queue = queue.Queue()
+# Guards each queued item's claimed/cancelled flags, so a timed-out request and the flusher agree on its fate
+_claim_lock = threading.Lock()
+
+def flusher():
+    while True:
+        # Block for the first submission, then take whatever else arrived meanwhile
+        batch = [_submit_queue.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(_submit_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            with writer() as conn:
+                # Drop submissions whose request already gave up; the rest can no longer be cancelled
+                with _claim_lock:
+                    batch = [item for item in batch if not item['cancelled']]
+                    for item in batch:
+                        item['claimed'] = True
+                if not batch:
+                    continue
+                
+                c = conn.cursor()
+                c.execute('BEGIN IMMEDIATE')
+                c.executemany(INSERT_RESPONSE_SQL, [item['row'] for item in batch])
+                last_id = c.execute('SELECT last_insert_rowid()').fetchone()[0]
+                c.execute('COMMIT')
+            
+            # The writer holds the lock for the whole batch, so its ids are consecutive
+            first_id = last_id - len(batch) + 1
+            for offset, item in enumerate(batch):
+                item['id'] = first_id + offset
+        except Exception as e:
+            for item in batch:
+                item['error'] = e
+        
+        for item in batch:
+            item['done'].set()
+
+threading.Thread(target=flusher, daemon=True).start()
+
+# Queue a row for insertion and wait for its id
+def queue_submission(row):
+    item = {'row': row, 'done': threading.Event(), 'id': None, 'error': None, 'claimed': False, 'cancelled': False}
+    _submit_queue.put(item)
+    if not item['done'].wait(WRITE_TIMEOUT):
+        # Only report a timeout if the row is guaranteed never to be written
+        with _claim_lock:
+            if not item['claimed']:
+                item['cancelled'] = True
+                raise TimeoutError('Timed out waiting for the database write')
+        # The flusher is already writing it, which busy_timeout bounds, so wait for the outcome
+        item['done'].wait()
+    if item['error'] is not None:
+        raise item['error']
+    return item['id']
+
+# Cheap fingerprint of the table contents, used as the ETag of the polled endpoints.
+# Anything else that shapes the response body (e.g. paging arguments) is passed in as extra.
+def _responses_version(*extra):
+    with reader() as conn:
+        row = conn.execute(RESPONSES_VERSION_SQL).fetchone()
+    return hashlib.blake2b(repr((row, extra)).encode(), digest_size=8).hexdigest()
+
+# Whether the client's If-None-Match names this ETag.
+# Flask-Compress appends ':<encoding>' to the ETags of responses it compresses, so ignore that suffix.
+def _etag_matches(etag):
+    return any(tag.split(':', 1)[0] == etag for tag in request.if_none_match)
+
+# Return a 304 if the client already has this version, otherwise None
+def _not_modified(etag):
+    if _etag_matches(etag):
+        return '', 304, {'ETag': f'"{etag}"', 'Cache-Control': POLL_CACHE_CONTROL}
+    return None
+
+# Attach validators so polling clients can revalidate instead of re-downloading
+def _with_etag(response, etag):
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = POLL_CACHE_CONTROL
+    return response
+
+# Serve the main HTML file (Nginx serves it directly in production, see nginx.conf).
+# It names the asset URLs, so it is always revalidated rather than cached for the day.
 @app.route('/')
 def index():
-    return send_from_directory('.', 'index.html')
+    return send_from_directory(app.static_folder, 'index.html', max_age=0)
+
+# Shape of a survey submission; the decoder validates the raw body in one pass without building a dict
+NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
 
-# Serve static files (images, CSS, JS)
-@app.route('/<path:filename>')
-def serve_static(filename):
-    return send_from_directory('.', filename)
+class SubmitRequest(msgspec.Struct):
+    q1: NonEmptyStr
+    q2: Annotated[list[str], msgspec.Meta(min_length=1)] | NonEmptyStr
+    q4: NonEmptyStr
+    q5: NonEmptyStr
+    portal_rating: str | None = None
+    llm_rating: str | None = None
+    has_improvements: bool = False
+    improvements: str = ''
+
+_submit_decoder = msgspec.json.Decoder(SubmitRequest)
 
 # API endpoint to submit survey
-@app.route('/api/submit', methods=['POST', 'OPTIONS'])
+@app.route('/api/submit', methods=['POST'])
 def submit_survey():
-    if request.method == 'OPTIONS':
-        return '', 200
-    
     try:
-        data = request.get_json()
-        print(f"Received survey data: {data}")
-        
-        # Validate required fields
-        required_fields = ['q1', 'q2', 'q4', 'q5']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({'status': 'error', 'message': f'Missing required field: {field}'}), 400
+        try:
+            req = _submit_decoder.decode(request.get_data(cache=False))
+        except msgspec.DecodeError as e:
+            return jsonify({'status': 'error', 'message': f'Invalid submission: {e}'}), 400
+        log.debug('Received survey data: %s', req)
         
-        # Convert q2 list to string
-        if isinstance(data['q2'], list):
-            q2_string = ','.join(data['q2'])
-        else:
-            q2_string = str(data['q2'])
-        
-        # Connect to database
-        conn = sqlite3.connect('survey.db')
-        c = conn.cursor()
+        # Store q2 as a JSON array
+        q2 = req.q2 if isinstance(req.q2, list) else [req.q2]
         
         # Insert response
-        c.execute('''
-            INSERT INTO survey_responses 
-            (q1, q2, portal_rating, llm_rating, q4, q5, has_improvements, improvements)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            str(data['q1']),
-            q2_string,
-            str(data.get('portal_rating', '')),
-            str(data.get('llm_rating', '')),
-            str(data['q4']),
-            str(data['q5']),
-            1 if data.get('has_improvements') else 0,
-            str(data.get('improvements', ''))
+        response_id = queue_submission((
+            req.q1,
+            orjson.dumps(q2).decode(),
+            # Unanswered ratings are stored as NULL so AVG skips them
+            req.portal_rating or None,
+            req.llm_rating or None,
+            req.q4,
+            req.q5,
+            1 if req.has_improvements else 0,
+            req.improvements
         ))
         
-        conn.commit()
-        response_id = c.lastrowid
-        conn.close()
-        
-        print(f"✓ Survey response saved with ID: {response_id}")
+        _invalidate_stats()
+        log.info('Survey response saved with ID: %s', response_id)
         
         return jsonify({
             'status': 'success',
@@ -106,641 +405,229 @@ def submit_survey():
         }), 200
         
     except Exception as e:
-        print(f"✗ Error saving survey: {str(e)}")
+        log.error('Error saving survey: %s', e)
         return jsonify({
             'status': 'error',
             'message': f'Server error: {str(e)}'
         }), 500
 
-# API endpoint to get all responses
+# API endpoint to get responses, one page at a time
 @app.route('/api/responses', methods=['GET'])
 def get_responses():
     try:
-        conn = sqlite3.connect('survey.db')
-        conn.row_factory = sqlite3.Row  # This enables column access by name
-        c = conn.cursor()
+        try:
+            limit = int(request.args.get('limit', RESPONSES_PAGE_SIZE))
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        limit = min(max(limit, 1), RESPONSES_MAX_PAGE_SIZE)
+        
+        # Pages continue below the id of the last row of the previous page
+        before_id = request.args.get('before_id')
+        if before_id is not None:
+            try:
+                before_id = int(before_id)
+            except ValueError:
+                return jsonify({'error': 'before_id must be an integer'}), 400
         
-        c.execute('SELECT * FROM survey_responses ORDER BY timestamp DESC')
-        rows = c.fetchall()
+        etag = _responses_version(limit, before_id)
+        not_modified = _not_modified(etag)
+        if not_modified:
+            return not_modified
         
-        # Convert rows to list of dictionaries
-        responses = []
-        for row in rows:
-            response_dict = dict(row)
-            # Convert q2 string back to list
-            if response_dict['q2']:
-                response_dict['q2'] = response_dict['q2'].split(',')
+        # Fetch one extra row to learn whether another page follows
+        with reader() as conn:
+            if before_id is not None:
+                rows = conn.execute(SELECT_RESPONSES_BEFORE_SQL, (before_id, limit + 1)).fetchall()
             else:
-                response_dict['q2'] = []
-            responses.append(response_dict)
+                rows = conn.execute(SELECT_RESPONSES_PAGE_SQL, (limit + 1,)).fetchall()
+        
+        next_before_id = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_before_id = rows[-1][0]
         
-        conn.close()
+        # SQLite already encoded each row, so orjson copies the text through untouched
+        fragment = orjson.Fragment
+        items = [fragment(r[1]) for r in rows]
         
-        return jsonify(responses), 200
+        return _with_etag(jsonify({'items': items, 'next_before_id': next_before_id}), etag), 200
         
     except Exception as e:
-        print(f"Error fetching responses: {e}")
+        log.error('Error fetching responses: %s', e)
         return jsonify({'error': str(e)}), 500
 
+# Aggregate statistics over all responses
+def compute_stats():
+    with reader() as conn:
+        c = conn.cursor()
+        
+        c.execute(STATS_TOTALS_SQL)
+        total, avg_portal, avg_llm, with_improvements = c.fetchone()
+        avg_portal = avg_portal or 0
+        avg_llm = avg_llm or 0
+        
+        c.execute(STATS_DISTRIBUTIONS_SQL)
+        distributions = {'q1': {}, 'q4': {}, 'q5': {}}
+        for question, answer, count in c.fetchall():
+            distributions[question][answer] = count
+        q1_stats = distributions['q1']
+        q4_stats = distributions['q4']
+        q5_stats = distributions['q5']
+    
+    return {
+        'total_responses': total,
+        'q1_distribution': q1_stats,
+        'average_ratings': {
+            'portal': round(float(avg_portal), 1),
+            'llm': round(float(avg_llm), 1)
+        },
+        'q4_distribution': q4_stats,
+        'q5_distribution': q5_stats,
+        'has_improvements': {
+            'yes': with_improvements,
+            'no': total - with_improvements
+        }
+    }
+
+# Serialized /api/stats body, reused for STATS_TTL seconds so dashboard polling skips even the
+# version query. Clients already accept this much staleness (see POLL_CACHE_CONTROL).
+STATS_TTL = 5
+# entry is (monotonic time, etag, body bytes); writes bump generation so entries built before them are discarded
+_stats_cache = {'entry': None, 'generation': 0}
+_stats_lock = threading.Lock()
+
+def _invalidate_stats():
+    with _stats_lock:
+        _stats_cache['generation'] += 1
+        _stats_cache['entry'] = None
+
 # API endpoint to get statistics
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     try:
-        conn = sqlite3.connect('survey.db')
-        c = conn.cursor()
-        
-        # Get total count
-        c.execute('SELECT COUNT(*) as total FROM survey_responses')
-        total = c.fetchone()[0]
-        
-        # Get Q1 distribution
-        c.execute('SELECT q1, COUNT(*) as count FROM survey_responses GROUP BY q1')
-        q1_stats = dict(c.fetchall())
-        
-        # Get average ratings
-        c.execute('SELECT AVG(CAST(portal_rating as REAL)) FROM survey_responses WHERE portal_rating != "" AND portal_rating IS NOT NULL')
-        avg_portal = c.fetchone()[0] or 0
-        
-        c.execute('SELECT AVG(CAST(llm_rating as REAL)) FROM survey_responses WHERE llm_rating != "" AND llm_rating IS NOT NULL')
-        avg_llm = c.fetchone()[0] or 0
-        
-        # Get Q4 distribution
-        c.execute('SELECT q4, COUNT(*) as count FROM survey_responses GROUP BY q4 ORDER BY count DESC')
-        q4_stats = dict(c.fetchall())
+        with _stats_lock:
+            entry = _stats_cache['entry']
+            generation = _stats_cache['generation']
         
-        # Get Q5 distribution
-        c.execute('SELECT q5, COUNT(*) as count FROM survey_responses GROUP BY q5 ORDER BY count DESC')
-        q5_stats = dict(c.fetchall())
+        if entry is None or time.monotonic() - entry[0] >= STATS_TTL:
+            etag = _responses_version()
+            if entry is not None and entry[1] == etag:
+                entry = (time.monotonic(), etag, entry[2])
+            else:
+                entry = (time.monotonic(), etag, orjson.dumps(compute_stats()))
+            # A write that landed meanwhile may not be reflected here, so only keep the entry if none did
+            with _stats_lock:
+                if _stats_cache['generation'] == generation:
+                    _stats_cache['entry'] = entry
+        _, etag, body = entry
         
-        conn.close()
+        not_modified = _not_modified(etag)
+        if not_modified:
+            return not_modified
         
-        return jsonify({
-            'total_responses': total,
-            'q1_distribution': q1_stats,
-            'average_ratings': {
-                'portal': round(float(avg_portal), 1),
-                'llm': round(float(avg_llm), 1)
-            },
-            'q4_distribution': q4_stats,
-            'q5_distribution': q5_stats,
-            'has_improvements': {
-                'yes': sum(1 for _ in q4_stats if 'improvements' in str(_).lower()),
-                'no': total - sum(1 for _ in q4_stats if 'improvements' in str(_).lower())
-            }
-        }), 200
+        return _with_etag(Response(body, mimetype='application/json'), etag), 200
         
     except Exception as e:
-        print(f"Error getting stats: {e}")
+        log.error('Error getting stats: %s', e)
         return jsonify({'error': str(e)}), 500
 
 # API endpoint to export responses as CSV
 @app.route('/api/export/csv', methods=['GET'])
 def export_csv():
     try:
-        conn = sqlite3.connect('survey.db')
-        c = conn.cursor()
-        
-        c.execute('SELECT * FROM survey_responses ORDER BY timestamp DESC')
-        rows = c.fetchall()
-        columns = [description[0] for description in c.description]
-        
-        conn.close()
-        
-        # Create CSV in memory
-        output = StringIO()
-        writer = csv.writer(output)
-        writer.writerow(columns)
-        writer.writerows(rows)
+        # Check out a connection and start the query before the response begins, so a busy pool
+        # or a failing query still gets the error response below rather than a broken stream
+        with ExitStack() as stack:
+            conn = stack.enter_context(reader())
+            c = conn.cursor()
+            stack.callback(c.close)
+            c.execute(EXPORT_RESPONSES_SQL)
+            # From here on the response owns the cursor and connection
+            release = stack.pop_all()
         
-        # Prepare response
-        csv_data = output.getvalue()
-        output.close()
+        # Stream rows straight from the cursor so the table is never held in memory
+        def generate():
+            output = StringIO()
+            writer = csv.writer(output)
+            writer.writerow(RESPONSE_COLUMNS)
+            yield output.getvalue()
+            # One chunk per batch of rows keeps writes (and compressor flushes) few and large
+            while True:
+                rows = c.fetchmany(EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                output.seek(0)
+                output.truncate()
+                writer.writerows(rows)
+                yield output.getvalue()
         
-        return csv_data, 200, {
-            'Content-Type': 'text/csv',
+        response = Response(stream_with_context(generate()), 200, {
+            'Content-Type': 'text/csv; charset=utf-8',
             'Content-Disposition': f'attachment; filename=survey_responses_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        }
+        })
+        # The server closes every response, even one whose body is never read, so this always runs
+        response.call_on_close(release.close)
+        return response
         
     except Exception as e:
-        print(f"Error exporting CSV: {e}")
+        log.error('Error exporting CSV: %s', e)
         return jsonify({'error': str(e)}), 500
 
-# Admin page to view responses
+# Admin page to view responses, read once at startup; its CSS and JS are static files
+with open(os.path.join(app.root_path, 'templates', 'admin.html'), 'rb') as f:
+    _ADMIN_HTML = f.read()
+
+# Tag the asset URLs with a content hash, so a refreshed page never runs against a stale cached copy
+for _asset in ('admin.css', 'admin.js'):
+    with open(os.path.join(app.static_folder, _asset), 'rb') as f:
+        _asset_version = hashlib.md5(f.read()).hexdigest()[:12]
+    _ADMIN_HTML = _ADMIN_HTML.replace(f'/static/{_asset}"'.encode(), f'/static/{_asset}?v={_asset_version}"'.encode())
+
+_ADMIN_ETAG = hashlib.md5(_ADMIN_HTML).hexdigest()
+
+ADMIN_CACHE_CONTROL = 'public, max-age=3600'
+
 @app.route('/admin')
 def admin():
-    return '''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Survey Responses Admin</title>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {
-                box-sizing: border-box;
-                margin: 0;
-                padding: 0;
-                font-family: Arial, sans-serif;
-            }
-            body {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container {
-                max-width: 1400px;
-                margin: 0 auto;
-                background: white;
-                padding: 30px;
-                border-radius: 15px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            }
-            .header {
-                text-align: center;
-                margin-bottom: 30px;
-                padding-bottom: 20px;
-                border-bottom: 2px solid #f0f0f0;
-            }
-            h1 {
-                color: #2c3e50;
-                font-size: 2.5rem;
-                margin-bottom: 10px;
-            }
-            .subtitle {
-                color: #7f8c8d;
-                font-size: 1.1rem;
-            }
-            .controls {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 10px;
-                margin-bottom: 30px;
-                padding: 20px;
-                background: #f8f9fa;
-                border-radius: 10px;
-            }
-            button {
-                padding: 12px 24px;
-                border: none;
-                border-radius: 8px;
-                font-size: 1rem;
-                font-weight: 600;
-                cursor: pointer;
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                transition: all 0.3s ease;
-            }
-            button:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }
-            .btn-primary {
-                background: #3498db;
-                color: white;
-            }
-            .btn-success {
-                background: #27ae60;
-                color: white;
-            }
-            .btn-danger {
-                background: #e74c3c;
-                color: white;
-            }
-            .btn-secondary {
-                background: #95a5a6;
-                color: white;
-            }
-            .stats-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .stat-card {
-                background: white;
-                padding: 25px;
-                border-radius: 10px;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.05);
-                border-left: 5px solid #3498db;
-            }
-            .stat-card h3 {
-                color: #2c3e50;
-                margin-bottom: 15px;
-                font-size: 1.2rem;
-            }
-            .stat-value {
-                font-size: 2.5rem;
-                font-weight: bold;
-                color: #3498db;
-                margin-bottom: 10px;
-            }
-            .stat-label {
-                color: #7f8c8d;
-                font-size: 0.9rem;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin-top: 20px;
-                background: white;
-                border-radius: 10px;
-                overflow: hidden;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.05);
-            }
-            th, td {
-                padding: 15px;
-                text-align: left;
-                border-bottom: 1px solid #f0f0f0;
-                font-size: 14px;
-            }
-            th {
-                background: #3498db;
-                color: white;
-                font-weight: 600;
-                position: sticky;
-                top: 0;
-            }
-            tr:hover {
-                background-color: #f8f9fa;
-            }
-            .badge {
-                display: inline-block;
-                padding: 4px 12px;
-                border-radius: 20px;
-                font-size: 12px;
-                font-weight: bold;
-                text-transform: uppercase;
-            }
-            .badge-portal {
-                background: #3498db;
-                color: white;
-            }
-            .badge-llm {
-                background: #9b59b6;
-                color: white;
-            }
-            .rating {
-                font-weight: bold;
-                padding: 4px 10px;
-                border-radius: 5px;
-                display: inline-block;
-            }
-            .rating-portal {
-                background: #d6eaf8;
-                color: #21618c;
-            }
-            .rating-llm {
-                background: #e8daef;
-                color: #6c3483;
-            }
-            .improvements {
-                max-width: 300px;
-                word-wrap: break-word;
-                line-height: 1.4;
-                font-size: 13px;
-            }
-            .timestamp {
-                font-size: 12px;
-                color: #7f8c8d;
-            }
-            .no-data {
-                text-align: center;
-                padding: 40px;
-                color: #95a5a6;
-                font-size: 1.2rem;
-            }
-            .loading {
-                text-align: center;
-                padding: 40px;
-                color: #3498db;
-            }
-            @media (max-width: 768px) {
-                .container {
-                    padding: 15px;
-                }
-                .controls {
-                    flex-direction: column;
-                }
-                button {
-                    width: 100%;
-                    justify-content: center;
-                }
-                table {
-                    display: block;
-                    overflow-x: auto;
-                }
-            }
-        </style>
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1><i class="fas fa-chart-bar"></i> Survey Responses Dashboard</h1>
-                <p class="subtitle">Real-time monitoring of accessibility visualization survey responses</p>
-            </div>
-            
-            <div class="controls">
-                <button class="btn-primary" onclick="loadData()">
-                    <i class="fas fa-sync-alt"></i> Refresh Data
-                </button>
-                <button class="btn-success" onclick="exportCSV()">
-                    <i class="fas fa-download"></i> Export CSV
-                </button>
-                <button class="btn-secondary" onclick="viewStats()">
-                    <i class="fas fa-chart-pie"></i> View Statistics
-                </button>
-                <button class="btn-danger" onclick="clearData()">
-                    <i class="fas fa-trash-alt"></i> Clear All Data
-                </button>
-            </div>
-            
-            <div class="stats-grid" id="statsGrid">
-                <div class="loading" id="loadingStats">
-                    <i class="fas fa-spinner fa-spin"></i> Loading statistics...
-                </div>
-            </div>
-            
-            <div style="overflow-x: auto;">
-                <table id="responsesTable">
-                    <thead>
-                        <tr>
-                            <th>ID</th>
-                            <th>Preferred Graph</th>
-                            <th>Strengths</th>
-                            <th>Portal Rating</th>
-                            <th>LLM Rating</th>
-                            <th>Use Case</th>
-                            <th>Future Use</th>
-                            <th>Improvements</th>
-                            <th>Submitted</th>
-                        </tr>
-                    </thead>
-                    <tbody id="responsesBody">
-                        <tr>
-                            <td colspan="9" class="loading">
-                                <i class="fas fa-spinner fa-spin"></i> Loading responses...
-                            </td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <script>
-            async function loadData() {
-                try {
-                    // Show loading state
-                    document.getElementById('responsesBody').innerHTML = `
-                        <tr>
-                            <td colspan="9" class="loading">
-                                <i class="fas fa-spinner fa-spin"></i> Loading responses...
-                            </td>
-                        </tr>
-                    `;
-                    
-                    // Load responses
-                    const response = await fetch('/api/responses');
-                    const data = await response.json();
-                    
-                    // Load statistics
-                    await loadStatistics();
-                    
-                    // Update table
-                    updateTable(data);
-                    
-                } catch (error) {
-                    console.error('Error loading data:', error);
-                    document.getElementById('responsesBody').innerHTML = `
-                        <tr>
-                            <td colspan="9" style="color: #e74c3c; text-align: center; padding: 30px;">
-                                <i class="fas fa-exclamation-triangle"></i> Error loading data. Please try again.
-                            </td>
-                        </tr>
-                    `;
-                }
-            }
-            
-            async function loadStatistics() {
-                try {
-                    const response = await fetch('/api/stats');
-                    const stats = await response.json();
-                    
-                    const statsGrid = document.getElementById('statsGrid');
-                    statsGrid.innerHTML = `
-                        <div class="stat-card">
-                            <h3><i class="fas fa-users"></i> Total Responses</h3>
-                            <div class="stat-value">${stats.total_responses || 0}</div>
-                            <div class="stat-label">Survey Submissions</div>
-                        </div>
-                        <div class="stat-card">
-                            <h3><i class="fas fa-project-diagram"></i> Portal Graph</h3>
-                            <div class="stat-value">${stats.q1_distribution?.portal || 0}</div>
-                            <div class="stat-label">Preferred by users</div>
-                        </div>
-                        <div class="stat-card">
-                            <h3><i class="fas fa-brain"></i> LLM Graph</h3>
-                            <div class="stat-value">${stats.q1_distribution?.llm || 0}</div>
-                            <div class="stat-label">Preferred by users</div>
-                        </div>
-                        <div class="stat-card">
-                            <h3><i class="fas fa-star"></i> Average Ratings</h3>
-                            <div class="stat-value">${stats.average_ratings?.portal || 0}/10</div>
-                            <div class="stat-label">Portal: ${stats.average_ratings?.portal || 0}, LLM: ${stats.average_ratings?.llm || 0}</div>
-                        </div>
-                    `;
-                    
-                } catch (error) {
-                    console.error('Error loading statistics:', error);
-                }
-            }
-            
-            function updateTable(data) {
-                const tbody = document.getElementById('responsesBody');
-                
-                if (!data || data.length === 0) {
-                    tbody.innerHTML = `
-                        <tr>
-                            <td colspan="9" class="no-data">
-                                <i class="fas fa-inbox"></i><br>
-                                No survey responses yet
-                            </td>
-                        </tr>
-                    `;
-                    return;
-                }
-                
-                tbody.innerHTML = '';
-                
-                data.forEach(item => {
-                    const row = document.createElement('tr');
-                    
-                    // Format strengths
-                    const strengths = Array.isArray(item.q2) 
-                        ? item.q2.map(str => `<div style="margin: 3px 0; font-size: 12px; color: #2c3e50;">✓ ${str}</div>`).join('')
-                        : `<div style="font-size: 12px;">${item.q2}</div>`;
-                    
-                    // Format improvements
-                    const improvements = item.has_improvements && item.improvements
-                        ? `<div class="improvements">${item.improvements}</div>`
-                        : '<span style="color: #95a5a6;">None</span>';
-                    
-                    row.innerHTML = `
-                        <td><strong>#${item.id}</strong></td>
-                        <td>
-                            <span class="badge ${item.q1 === 'portal' ? 'badge-portal' : 'badge-llm'}">
-                                ${item.q1 === 'portal' ? 'Portal Graph' : 'LLM Graph'}
-                            </span>
-                        </td>
-                        <td>${strengths}</td>
-                        <td>
-                            ${item.portal_rating ? `
-                                <span class="rating rating-portal">
-                                    ${item.portal_rating}/10
-                                </span>
-                            ` : '<span style="color: #95a5a6;">N/A</span>'}
-                        </td>
-                        <td>
-                            ${item.llm_rating ? `
-                                <span class="rating rating-llm">
-                                    ${item.llm_rating}/10
-                                </span>
-                            ` : '<span style="color: #95a5a6;">N/A</span>'}
-                        </td>
-                        <td>
-                            <div style="font-size: 13px; max-width: 200px;">
-                                ${formatUseCase(item.q4)}
-                            </div>
-                        </td>
-                        <td>
-                            <div style="font-size: 13px;">
-                                ${formatFutureUse(item.q5)}
-                            </div>
-                        </td>
-                        <td class="improvements">${improvements}</td>
-                        <td class="timestamp">
-                            ${formatDate(item.timestamp)}
-                        </td>
-                    `;
-                    tbody.appendChild(row);
-                });
-            }
-            
-            function formatUseCase(q4) {
-                const useCases = {
-                    'test': 'Test Case Generation',
-                    'user': 'User Story Generation',
-                    'business': 'Business Insights',
-                    'code': 'Code Review',
-                    'sprint': 'Sprint Planning',
-                    'architecture': 'Architecture Design',
-                    'all': 'All are equally helpful'
-                };
-                return useCases[q4] || q4;
-            }
-            
-            function formatFutureUse(q5) {
-                const futureUses = {
-                    'definitely': 'Definitely will use',
-                    'probably': 'Probably will use',
-                    'might': 'Might use',
-                    'probably-not': 'Probably won\'t use',
-                    'definitely-not': 'Definitely won\'t use'
-                };
-                return futureUses[q5] || q5;
-            }
-            
-            function formatDate(timestamp) {
-                const date = new Date(timestamp);
-                return date.toLocaleDateString() + ' ' + date.toLocaleTimeString([], {hour: '2-digit', minute:'2-digit'});
-            }
-            
-            function exportCSV() {
-                window.open('/api/export/csv', '_blank');
-            }
-            
-            async function viewStats() {
-                try {
-                    const response = await fetch('/api/stats');
-                    const stats = await response.json();
-                    
-                    let statsHTML = '<h2>Detailed Statistics</h2>';
-                    statsHTML += `<p><strong>Total Responses:</strong> ${stats.total_responses}</p>`;
-                    statsHTML += `<p><strong>Portal vs LLM:</strong> ${stats.q1_distribution?.portal || 0} vs ${stats.q1_distribution?.llm || 0}</p>`;
-                    statsHTML += `<p><strong>Average Ratings:</strong> Portal: ${stats.average_ratings?.portal || 0}/10, LLM: ${stats.average_ratings?.llm || 0}/10</p>`;
-                    
-                    alert(statsHTML);
-                } catch (error) {
-                    alert('Error loading statistics: ' + error.message);
-                }
-            }
-            
-            async function clearData() {
-                if (!confirm('⚠️ WARNING: This will delete ALL survey responses. This action cannot be undone.\n\nAre you sure?')) {
-                    return;
-                }
-                
-                const password = prompt('Enter admin password to confirm:');
-                if (password !== 'admin123') {
-                    alert('Incorrect password. Operation cancelled.');
-                    return;
-                }
-                
-                try {
-                    const response = await fetch('/api/responses', {
-                        method: 'DELETE'
-                    });
-                    
-                    if (response.ok) {
-                        alert('All responses have been cleared.');
-                        loadData();
-                    } else {
-                        alert('Error clearing responses.');
-                    }
-                } catch (error) {
-                    alert('Error: ' + error.message);
-                }
-            }
-            
-            // Add DELETE endpoint for responses
-            app.route('/api/responses', methods=['DELETE'])(async function delete_responses() {
-                try:
-                    conn = sqlite3.connect('survey.db')
-                    c = conn.cursor()
-                    c.execute('DELETE FROM survey_responses')
-                    conn.commit()
-                    conn.close()
-                    return jsonify({'status': 'success', 'message': 'All responses cleared'}), 200
-                except Exception as e:
-                    return jsonify({'status': 'error', 'message': str(e)}), 500
-            })
-            
-            // Load data on page load
-            document.addEventListener('DOMContentLoaded', loadData);
-            
-            // Auto-refresh every 60 seconds
-            setInterval(loadData, 60000);
-        </script>
-    </body>
-    </html>
-    '''
+    if _etag_matches(_ADMIN_ETAG):
+        return '', 304, {'ETag': f'"{_ADMIN_ETAG}"', 'Cache-Control': ADMIN_CACHE_CONTROL}
+    
+    response = Response(_ADMIN_HTML, mimetype='text/html')
+    response.set_etag(_ADMIN_ETAG)
+    response.headers['Cache-Control'] = ADMIN_CACHE_CONTROL
+    return response
+
+# SHA-256 of the admin password, hex encoded; defaults to the hash of 'admin123'
+DEFAULT_ADMIN_PW_SHA256 = '240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9'
+_ADMIN_HASH = bytes.fromhex(os.environ.get('ADMIN_PW_SHA256', DEFAULT_ADMIN_PW_SHA256))
 
 # DELETE endpoint for responses
 @app.route('/api/responses', methods=['DELETE'])
 def delete_responses():
     try:
-        password = request.args.get('password')
-        if password != 'admin123':
+        password = request.args.get('password', '')
+        # Compare digests in constant time so response timing reveals nothing about the password
+        if not hmac.compare_digest(hashlib.sha256(password.encode()).digest(), _ADMIN_HASH):
             return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
             
-        conn = sqlite3.connect('survey.db')
-        c = conn.cursor()
-        c.execute('DELETE FROM survey_responses')
-        conn.commit()
-        conn.close()
+        with writer() as conn:
+            c = conn.cursor()
+            c.execute('BEGIN IMMEDIATE')
+            # A DELETE with no WHERE and no triggers clears the table and index b-trees whole
+            c.execute(DELETE_RESPONSES_SQL)
+            c.execute('COMMIT')
+            # Reclaim the freed pages; the rows are already gone if this cannot get the lock
+            try:
+                c.execute('VACUUM')
+            except sqlite3.OperationalError as e:
+                log.warning('Skipping VACUUM after clearing responses: %s', e)
+            # Refresh planner statistics after the bulk change
+            c.execute('ANALYZE')
+        _invalidate_stats()
         
         return jsonify({'status': 'success', 'message': 'All responses cleared'}), 200
     except Exception as e:
+        log.error('Error clearing responses: %s', e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 if __name__ == '__main__':
@@ -756,7 +643,14 @@ if __name__ == '__main__':
     print(f"📈 Statistics: http://localhost:{port}/api/stats")
     print(f"📥 CSV Export: http://localhost:{port}/api/export/csv")
     print("=" * 60)
-    print("💡 Admin password: admin123")
+    if 'ADMIN_PW_SHA256' not in os.environ:
+        print("💡 Admin password: admin123 (set ADMIN_PW_SHA256 to change it)")
     print("=" * 60)
     
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    # The Werkzeug dev server is for local development only; otherwise hand over to Gunicorn.
+    # Launched this way (e.g. on Replit) there is no Nginx in front, so listen on all interfaces.
+    if os.environ.get('FLASK_DEV'):
+        logging.basicConfig(level=logging.DEBUG)
+        app.run(host='0.0.0.0', port=port, debug=True, threaded=True)
+    else:
+        os.execvp('gunicorn', ['gunicorn', '-c', 'gunicorn.conf.py', '-b', f'0.0.0.0:{port}', 'main:app'])
\ No newline at end of file
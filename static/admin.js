@@ -0,0 +1,301 @@
+// Id below which the next page of responses starts, or null when the last page is loaded
+let nextBeforeId = null;
+// Id of the newest response in the table, or null when it is empty
+let newestId = null;
+
+async function loadData() {
+    newestId = null;
+
+    try {
+        // Show loading state
+        document.getElementById('responsesBody').innerHTML = `
+            <tr>
+                <td colspan="9" class="loading">
+                    <i class="fas fa-spinner fa-spin"></i> Loading responses...
+                </td>
+            </tr>
+        `;
+
+        // Load the newest page of responses
+        const response = await fetch('/api/responses');
+        const page = await response.json();
+
+        // Load statistics
+        await loadStatistics();
+
+        // Update table
+        updateTable(page.items);
+        setNextBeforeId(page.next_before_id);
+        newestId = page.items.length > 0 ? page.items[0].id : null;
+
+    } catch (error) {
+        console.error('Error loading data:', error);
+        document.getElementById('responsesBody').innerHTML = `
+            <tr>
+                <td colspan="9" style="color: #e74c3c; text-align: center; padding: 30px;">
+                    <i class="fas fa-exclamation-triangle"></i> Error loading data. Please try again.
+                </td>
+            </tr>
+        `;
+    }
+}
+
+async function loadStatistics() {
+    try {
+        const response = await fetch('/api/stats');
+        const stats = await response.json();
+
+        const statsGrid = document.getElementById('statsGrid');
+        statsGrid.innerHTML = `
+            <div class="stat-card">
+                <h3><i class="fas fa-users"></i> Total Responses</h3>
+                <div class="stat-value">${stats.total_responses || 0}</div>
+                <div class="stat-label">Survey Submissions</div>
+            </div>
+            <div class="stat-card">
+                <h3><i class="fas fa-project-diagram"></i> Portal Graph</h3>
+                <div class="stat-value">${stats.q1_distribution?.portal || 0}</div>
+                <div class="stat-label">Preferred by users</div>
+            </div>
+            <div class="stat-card">
+                <h3><i class="fas fa-brain"></i> LLM Graph</h3>
+                <div class="stat-value">${stats.q1_distribution?.llm || 0}</div>
+                <div class="stat-label">Preferred by users</div>
+            </div>
+            <div class="stat-card">
+                <h3><i class="fas fa-star"></i> Average Ratings</h3>
+                <div class="stat-value">${stats.average_ratings?.portal || 0}/10</div>
+                <div class="stat-label">Portal: ${stats.average_ratings?.portal || 0}, LLM: ${stats.average_ratings?.llm || 0}</div>
+            </div>
+        `;
+
+    } catch (error) {
+        console.error('Error loading statistics:', error);
+    }
+}
+
+// Auto-refresh: add responses newer than the table's top row, keeping pages loaded with Load More
+async function refreshData() {
+    if (newestId === null) {
+        return loadData();
+    }
+
+    try {
+        const response = await fetch('/api/responses');
+        const page = await response.json();
+
+        await loadStatistics();
+
+        const newer = page.items.filter(item => item.id > newestId);
+        // If no returned row is already in the table, the responses were cleared or the new rows
+        // do not reach back to it; either way start over
+        if (newer.length === page.items.length) {
+            return loadData();
+        }
+
+        if (newer.length > 0) {
+            document.getElementById('responsesBody').prepend(buildRows(newer));
+            newestId = newer[0].id;
+        }
+    } catch (error) {
+        console.error('Error refreshing responses:', error);
+    }
+}
+
+async function loadMore() {
+    if (nextBeforeId === null) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/responses?before_id=' + nextBeforeId);
+        const page = await response.json();
+
+        updateTable(page.items, true);
+        setNextBeforeId(page.next_before_id);
+    } catch (error) {
+        console.error('Error loading more responses:', error);
+    }
+}
+
+function setNextBeforeId(beforeId) {
+    nextBeforeId = beforeId;
+    document.getElementById('loadMore').style.display = beforeId === null ? 'none' : 'flex';
+}
+
+function updateTable(data, append = false) {
+    const tbody = document.getElementById('responsesBody');
+
+    if (append) {
+        appendRows(tbody, data);
+        return;
+    }
+
+    if (!data || data.length === 0) {
+        tbody.innerHTML = `
+            <tr>
+                <td colspan="9" class="no-data">
+                    <i class="fas fa-inbox"></i><br>
+                    No survey responses yet
+                </td>
+            </tr>
+        `;
+        return;
+    }
+
+    tbody.replaceChildren();
+    appendRows(tbody, data);
+}
+
+function appendRows(tbody, data) {
+    tbody.appendChild(buildRows(data));
+}
+
+// Build the rows off-document from the <template>, so the caller attaches them in one go
+function buildRows(data) {
+    const template = document.getElementById('rowTpl').content.firstElementChild;
+    const fragment = document.createDocumentFragment();
+
+    data.forEach(item => {
+        const row = template.cloneNode(true);
+
+        row.querySelector('.row-id').textContent = '#' + item.id;
+
+        const badge = row.querySelector('.badge');
+        badge.classList.add(item.q1 === 'portal' ? 'badge-portal' : 'badge-llm');
+        badge.textContent = item.q1 === 'portal' ? 'Portal Graph' : 'LLM Graph';
+
+        // Format strengths
+        const strengths = row.querySelector('.strengths');
+        (Array.isArray(item.q2) ? item.q2 : [item.q2]).forEach(str => {
+            const strength = document.createElement('div');
+            strength.className = 'strength';
+            strength.textContent = '✓ ' + str;
+            strengths.appendChild(strength);
+        });
+
+        setRating(row.querySelector('.portal-rating'), item.portal_rating, 'rating-portal');
+        setRating(row.querySelector('.llm-rating'), item.llm_rating, 'rating-llm');
+
+        row.querySelector('.use-case').textContent = formatUseCase(item.q4);
+        row.querySelector('.future-use').textContent = formatFutureUse(item.q5);
+
+        // Format improvements
+        const improvements = row.querySelector('td.improvements');
+        if (item.has_improvements && item.improvements) {
+            const text = document.createElement('div');
+            text.className = 'improvements';
+            text.textContent = item.improvements;
+            improvements.appendChild(text);
+        } else {
+            improvements.appendChild(emptyValue('None'));
+        }
+
+        row.querySelector('.timestamp').textContent = formatDate(item.timestamp);
+
+        fragment.appendChild(row);
+    });
+
+    return fragment;
+}
+
+function setRating(cell, rating, className) {
+    if (!rating) {
+        cell.appendChild(emptyValue('N/A'));
+        return;
+    }
+    const span = document.createElement('span');
+    span.className = 'rating ' + className;
+    span.textContent = rating + '/10';
+    cell.appendChild(span);
+}
+
+function emptyValue(text) {
+    const span = document.createElement('span');
+    span.className = 'empty-value';
+    span.textContent = text;
+    return span;
+}
+
+function formatUseCase(q4) {
+    const useCases = {
+        'test': 'Test Case Generation',
+        'user': 'User Story Generation',
+        'business': 'Business Insights',
+        'code': 'Code Review',
+        'sprint': 'Sprint Planning',
+        'architecture': 'Architecture Design',
+        'all': 'All are equally helpful'
+    };
+    return useCases[q4] || q4;
+}
+
+function formatFutureUse(q5) {
+    const futureUses = {
+        'definitely': 'Definitely will use',
+        'probably': 'Probably will use',
+        'might': 'Might use',
+        'probably-not': 'Probably won\'t use',
+        'definitely-not': 'Definitely won\'t use'
+    };
+    return futureUses[q5] || q5;
+}
+
+function formatDate(timestamp) {
+    const date = new Date(timestamp);
+    return date.toLocaleDateString() + ' ' + date.toLocaleTimeString([], {hour: '2-digit', minute:'2-digit'});
+}
+
+function exportCSV() {
+    window.open('/api/export/csv', '_blank');
+}
+
+async function viewStats() {
+    try {
+        const response = await fetch('/api/stats');
+        const stats = await response.json();
+
+        let statsHTML = '<h2>Detailed Statistics</h2>';
+        statsHTML += `<p><strong>Total Responses:</strong> ${stats.total_responses}</p>`;
+        statsHTML += `<p><strong>Portal vs LLM:</strong> ${stats.q1_distribution?.portal || 0} vs ${stats.q1_distribution?.llm || 0}</p>`;
+        statsHTML += `<p><strong>Average Ratings:</strong> Portal: ${stats.average_ratings?.portal || 0}/10, LLM: ${stats.average_ratings?.llm || 0}/10</p>`;
+
+        alert(statsHTML);
+    } catch (error) {
+        alert('Error loading statistics: ' + error.message);
+    }
+}
+
+async function clearData() {
+    if (!confirm('⚠️ WARNING: This will delete ALL survey responses. This action cannot be undone.\n\nAre you sure?')) {
+        return;
+    }
+
+    const password = prompt('Enter admin password to confirm:');
+    if (password === null) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/responses?password=' + encodeURIComponent(password), {
+            method: 'DELETE'
+        });
+
+        if (response.ok) {
+            alert('All responses have been cleared.');
+            loadData();
+        } else if (response.status === 401) {
+            alert('Incorrect password. Operation cancelled.');
+        } else {
+            alert('Error clearing responses.');
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
+
+// Load data on page load
+document.addEventListener('DOMContentLoaded', loadData);
+
+// Auto-refresh every 60 seconds
+setInterval(refreshData, 60000);